@@ -19,19 +19,19 @@ ADNL_ADDRESS = "{hex}"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = Domain.build_set_site_record_body(ADNL_ADDRESS)
+        body = Domain.build_set_site_record_body(ADNL_ADDRESS)
 
-    tx_hash = await wallet.transfer(
-        destination=NFT_DOMAIN_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=NFT_DOMAIN_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print("Site record set successfully!")
-    print(f"Transaction hash: {tx_hash}")
+        print("Site record set successfully!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
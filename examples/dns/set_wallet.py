@@ -21,19 +21,19 @@ WALLET_ADDRESS = "UQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = Domain.build_set_wallet_record_body(Address(WALLET_ADDRESS))
+        body = Domain.build_set_wallet_record_body(Address(WALLET_ADDRESS))
 
-    tx_hash = await wallet.transfer(
-        destination=NFT_DOMAIN_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=NFT_DOMAIN_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print("Wallet record set successfully!")
-    print(f"Transaction hash: {tx_hash}")
+        print("Wallet record set successfully!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -18,19 +18,19 @@ ADMIN_ADDRESS = "UQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    subdomain_manager = SubdomainManager(Address(ADMIN_ADDRESS))
+        subdomain_manager = SubdomainManager(Address(ADMIN_ADDRESS))
 
-    tx_hash = await wallet.transfer(
-        destination=subdomain_manager.address,
-        amount=0.05,
-        state_init=subdomain_manager.state_init,
-    )
+        tx_hash = await wallet.transfer(
+            destination=subdomain_manager.address,
+            amount=0.05,
+            state_init=subdomain_manager.state_init,
+        )
 
-    print(f"Successfully deployed Subdomain Manager at address: {subdomain_manager.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully deployed Subdomain Manager at address: {subdomain_manager.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -24,19 +24,19 @@ SUBDOMAIN = "example"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = SubdomainManager.build_set_next_resolver_record_body(SUBDOMAIN, Address(CONTRACT_ADDRESS))
+        body = SubdomainManager.build_set_next_resolver_record_body(SUBDOMAIN, Address(CONTRACT_ADDRESS))
 
-    tx_hash = await wallet.transfer(
-        destination=SUBDOMAIN_MANAGER_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=SUBDOMAIN_MANAGER_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print(f"Successfully registered subdomain and set the next resolver!")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully registered subdomain and set the next resolver!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
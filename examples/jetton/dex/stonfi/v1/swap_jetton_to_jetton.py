@@ -26,25 +26,25 @@ JETTON_AMOUNT = 1
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    to, value, body = await StonfiRouterV1(client).get_swap_jetton_to_jetton_tx_params(
-        user_wallet_address=wallet.address,
-        offer_jetton_address=Address(FROM_JETTON_MASTER_ADDRESS),
-        ask_jetton_address=Address(TO_JETTON_MASTER_ADDRESS),
-        offer_amount=to_nano(JETTON_AMOUNT, JETTON_DECIMALS),
-        min_ask_amount=0,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=to,
-        amount=to_amount(value),
-        body=body,
-    )
-
-    print("Successfully swapped Jetton to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        to, value, body = await StonfiRouterV1(client).get_swap_jetton_to_jetton_tx_params(
+            user_wallet_address=wallet.address,
+            offer_jetton_address=Address(FROM_JETTON_MASTER_ADDRESS),
+            ask_jetton_address=Address(TO_JETTON_MASTER_ADDRESS),
+            offer_amount=to_nano(JETTON_AMOUNT, JETTON_DECIMALS),
+            min_ask_amount=0,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=to,
+            amount=to_amount(value),
+            body=body,
+        )
+
+        print("Successfully swapped Jetton to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import aiohttp
 from pytoniq_core import Address
 
@@ -25,35 +27,66 @@ JETTON_DECIMALS = 9
 # Amount of Jettons to swap (in base units, considering decimals)
 JETTON_AMOUNT = 1
 
+# Shared HTTP session for STON.fi API requests, created on first use
+_session: Optional[aiohttp.ClientSession] = None
+
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    # Retrieve the correct router address before performing a swap
-    # The router address determines the entry point to the DEX for processing swaps
-    # and must be fetched dynamically based on the swap parameters.
-    router_address = await get_router_address()
-    stonfi_router = StonfiRouterV2(client, router_address=Address(router_address))
-
-    to, value, body = await stonfi_router.get_swap_jetton_to_jetton_tx_params(
-        user_wallet_address=wallet.address,
-        receiver_address=wallet.address,
-        refund_address=wallet.address,
-        offer_jetton_address=Address(FROM_JETTON_MASTER_ADDRESS),
-        ask_jetton_address=Address(TO_JETTON_MASTER_ADDRESS),
-        offer_amount=to_nano(JETTON_AMOUNT, JETTON_DECIMALS),
-        min_ask_amount=0,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=to,
-        amount=to_amount(value),
-        body=body,
-    )
-
-    print("Successfully swapped Jetton to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    try:
+        await swap()
+    finally:
+        await close_session()
+
+
+async def swap() -> None:
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        # Retrieve the correct router address before performing a swap
+        # The router address determines the entry point to the DEX for processing swaps
+        # and must be fetched dynamically based on the swap parameters.
+        router_address = await get_router_address()
+        stonfi_router = StonfiRouterV2(client, router_address=Address(router_address))
+
+        to, value, body = await stonfi_router.get_swap_jetton_to_jetton_tx_params(
+            user_wallet_address=wallet.address,
+            receiver_address=wallet.address,
+            refund_address=wallet.address,
+            offer_jetton_address=Address(FROM_JETTON_MASTER_ADDRESS),
+            ask_jetton_address=Address(TO_JETTON_MASTER_ADDRESS),
+            offer_amount=to_nano(JETTON_AMOUNT, JETTON_DECIMALS),
+            min_ask_amount=0,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=to,
+            amount=to_amount(value),
+            body=body,
+        )
+
+        print("Successfully swapped Jetton to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """ Return the shared HTTP session, creating it on first use so the connection is reused. """
+    global _session
+
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """ Close the shared HTTP session if it was created. """
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
 
 
 async def get_router_address() -> str:
@@ -69,14 +102,14 @@ async def get_router_address() -> str:
         "dex_v2": "true",
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, params=params, headers=headers) as response:
-            if response.status == 200:
-                content = await response.json()
-                return content.get("router_address")
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to get router address: {response.status}: {error_text}")
+    session = await get_session()
+    async with session.post(url, params=params, headers=headers) as response:
+        if response.status == 200:
+            content = await response.json()
+            return content.get("router_address")
+        else:
+            error_text = await response.text()
+            raise Exception(f"Failed to get router address: {response.status}: {error_text}")
 
 
 if __name__ == "__main__":
@@ -27,32 +27,32 @@ JETTON_AMOUNT = 1
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    # Retrieve the correct router address before performing a swap
-    # The router address determines the entry point to the DEX for processing swaps
-    # and must be fetched dynamically based on the swap parameters.
-    router_address = await get_router_address()
-    stonfi_router = StonfiRouterV2(client, router_address=Address(router_address))
-
-    to, value, body = await stonfi_router.get_swap_jetton_to_ton_tx_params(
-        offer_jetton_address=Address(FROM_JETTON_MASTER_ADDRESS),
-        receiver_address=wallet.address,
-        user_wallet_address=wallet.address,
-        offer_amount=to_nano(JETTON_AMOUNT, JETTON_DECIMALS),
-        min_ask_amount=0,
-        refund_address=wallet.address,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=to,
-        amount=to_amount(value),
-        body=body,
-    )
-
-    print("Successfully swapped Jetton to TON!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        # Retrieve the correct router address before performing a swap
+        # The router address determines the entry point to the DEX for processing swaps
+        # and must be fetched dynamically based on the swap parameters.
+        router_address = await get_router_address()
+        stonfi_router = StonfiRouterV2(client, router_address=Address(router_address))
+
+        to, value, body = await stonfi_router.get_swap_jetton_to_ton_tx_params(
+            offer_jetton_address=Address(FROM_JETTON_MASTER_ADDRESS),
+            receiver_address=wallet.address,
+            user_wallet_address=wallet.address,
+            offer_amount=to_nano(JETTON_AMOUNT, JETTON_DECIMALS),
+            min_ask_amount=0,
+            refund_address=wallet.address,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=to,
+            amount=to_amount(value),
+            body=body,
+        )
+
+        print("Successfully swapped Jetton to TON!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 async def get_router_address() -> str:
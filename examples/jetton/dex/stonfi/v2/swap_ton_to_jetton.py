@@ -27,32 +27,32 @@ TON_AMOUNT = 1
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    # Retrieve the correct router address before performing a swap
-    # The router address determines the entry point to the DEX for processing swaps
-    # and must be fetched dynamically based on the swap parameters.
-    router_address = await get_router_address()
-    stonfi_router = StonfiRouterV2(client, router_address=Address(router_address))
-
-    to, value, body = await stonfi_router.get_swap_ton_to_jetton_tx_params(
-        user_wallet_address=wallet.address,
-        receiver_address=wallet.address,
-        offer_jetton_address=Address(TO_JETTON_MASTER_ADDRESS),
-        offer_amount=to_nano(TON_AMOUNT),
-        min_ask_amount=0,
-        refund_address=wallet.address,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=to,
-        amount=to_amount(value),
-        body=body,
-    )
-
-    print("Successfully swapped TON to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        # Retrieve the correct router address before performing a swap
+        # The router address determines the entry point to the DEX for processing swaps
+        # and must be fetched dynamically based on the swap parameters.
+        router_address = await get_router_address()
+        stonfi_router = StonfiRouterV2(client, router_address=Address(router_address))
+
+        to, value, body = await stonfi_router.get_swap_ton_to_jetton_tx_params(
+            user_wallet_address=wallet.address,
+            receiver_address=wallet.address,
+            offer_jetton_address=Address(TO_JETTON_MASTER_ADDRESS),
+            offer_amount=to_nano(TON_AMOUNT),
+            min_ask_amount=0,
+            refund_address=wallet.address,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=to,
+            amount=to_amount(value),
+            body=body,
+        )
+
+        print("Successfully swapped TON to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 async def get_router_address() -> str:
@@ -19,21 +19,21 @@ JETTON_DECIMALS = 9
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
 
-    jetton_wallet_address = await JettonMaster.get_wallet_address(
-        client=client,
-        owner_address=OWNER_ADDRESS,
-        jetton_master_address=JETTON_MASTER_ADDRESS,
-    )
+        jetton_wallet_address = await JettonMaster.get_wallet_address(
+            client=client,
+            owner_address=OWNER_ADDRESS,
+            jetton_master_address=JETTON_MASTER_ADDRESS,
+        )
 
-    jetton_wallet_data = await JettonWallet.get_wallet_data(
-        client=client,
-        jetton_wallet_address=jetton_wallet_address,
-    )
+        jetton_wallet_data = await JettonWallet.get_wallet_data(
+            client=client,
+            jetton_wallet_address=jetton_wallet_address,
+        )
 
-    print(f"Jetton wallet balance (nano): {jetton_wallet_data.balance}")
-    print(f"Jetton wallet balance (Jettons): {to_amount(jetton_wallet_data.balance, JETTON_DECIMALS)}")
+        print(f"Jetton wallet balance (nano): {jetton_wallet_data.balance}")
+        print(f"Jetton wallet balance (Jettons): {to_amount(jetton_wallet_data.balance, JETTON_DECIMALS)}")
 
 
 if __name__ == "__main__":
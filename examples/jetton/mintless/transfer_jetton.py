@@ -26,48 +26,48 @@ COMMENT = "Hello from tonutils!"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    jetton_data = await get_jetton(client, wallet.address.to_str())
-    if jetton_data is None:
-        raise Exception("Jetton data not found. Are there jettons in this wallet?")
-
-    jetton_balance = int(jetton_data["balance"])
-    custom_payload_api_uri = jetton_data["jetton"]["custom_payload_api_uri"]
-    jetton_custom_payload = await get_payload(custom_payload_api_uri, wallet.address.to_str())
-    jetton_wallet_address = jetton_custom_payload["jetton_wallet"]
-
-    if not await is_claimed(client, jetton_wallet_address):
-        custom_payload = Cell.one_from_boc(jetton_custom_payload["custom_payload"])
-        state_init = StateInit.deserialize(Slice.one_from_boc(jetton_custom_payload["state_init"]))
-    else:
-        custom_payload = state_init = None
-
-    body = JettonWallet.build_transfer_body(
-        recipient_address=Address(DESTINATION_ADDRESS),
-        response_address=wallet.address,
-        jetton_amount=jetton_balance,
-        custom_payload=custom_payload,
-        forward_payload=(
-            begin_cell()
-            .store_uint(0, 32)
-            .store_snake_string(COMMENT)
-            .end_cell()
-        ),
-        forward_amount=1,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=jetton_wallet_address,
-        amount=0.1,
-        body=body,
-        state_init=state_init,
-        bounce=True,
-    )
-
-    print(f"Successfully transferred {to_amount(jetton_balance)} jettons!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        jetton_data = await get_jetton(client, wallet.address.to_str())
+        if jetton_data is None:
+            raise Exception("Jetton data not found. Are there jettons in this wallet?")
+
+        jetton_balance = int(jetton_data["balance"])
+        custom_payload_api_uri = jetton_data["jetton"]["custom_payload_api_uri"]
+        jetton_custom_payload = await get_payload(custom_payload_api_uri, wallet.address.to_str())
+        jetton_wallet_address = jetton_custom_payload["jetton_wallet"]
+
+        if not await is_claimed(client, jetton_wallet_address):
+            custom_payload = Cell.one_from_boc(jetton_custom_payload["custom_payload"])
+            state_init = StateInit.deserialize(Slice.one_from_boc(jetton_custom_payload["state_init"]))
+        else:
+            custom_payload = state_init = None
+
+        body = JettonWallet.build_transfer_body(
+            recipient_address=Address(DESTINATION_ADDRESS),
+            response_address=wallet.address,
+            jetton_amount=jetton_balance,
+            custom_payload=custom_payload,
+            forward_payload=(
+                begin_cell()
+                .store_uint(0, 32)
+                .store_snake_string(COMMENT)
+                .end_cell()
+            ),
+            forward_amount=1,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=jetton_wallet_address,
+            amount=0.1,
+            body=body,
+            state_init=state_init,
+            bounce=True,
+        )
+
+        print(f"Successfully transferred {to_amount(jetton_balance)} jettons!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 async def get_jetton(client: TonapiClient, addr: str) -> Union[Dict[str, Any], None]:
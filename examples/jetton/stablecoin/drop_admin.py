@@ -16,19 +16,19 @@ JETTON_MASTER_ADDRESS = "EQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = JettonMasterStablecoin.build_drop_admin_body()
+        body = JettonMasterStablecoin.build_drop_admin_body()
 
-    tx_hash = await wallet.transfer(
-        destination=JETTON_MASTER_ADDRESS,
-        amount=0.05,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=JETTON_MASTER_ADDRESS,
+            amount=0.05,
+            body=body,
+        )
 
-    print(f"Jetton Master admin has been successfully dropped!")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Jetton Master admin has been successfully dropped!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -24,22 +24,22 @@ NEW_DATA_CELL = Cell.one_from_boc("data hex")
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    body = JettonMasterStablecoin.build_upgrade_message_body(
-        new_code=NEW_CODE_CELL,
-        new_data=NEW_DATA_CELL,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=JETTON_MASTER_ADDRESS,
-        amount=0.05,
-        body=body,
-    )
-
-    print(f"Successfully upgraded the contract!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        body = JettonMasterStablecoin.build_upgrade_message_body(
+            new_code=NEW_CODE_CELL,
+            new_data=NEW_DATA_CELL,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=JETTON_MASTER_ADDRESS,
+            amount=0.05,
+            body=body,
+        )
+
+        print(f"Successfully upgraded the contract!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
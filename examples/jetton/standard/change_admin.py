@@ -21,21 +21,21 @@ NEW_ADMIN_ADDRESS = "UQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = JettonMaster.build_change_admin_body(
-        new_admin_address=Address(NEW_ADMIN_ADDRESS),
-    )
+        body = JettonMaster.build_change_admin_body(
+            new_admin_address=Address(NEW_ADMIN_ADDRESS),
+        )
 
-    tx_hash = await wallet.transfer(
-        destination=JETTON_MASTER_ADDRESS,
-        amount=0.05,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=JETTON_MASTER_ADDRESS,
+            amount=0.05,
+            body=body,
+        )
 
-    print(f"Successfully changed the admin of the Jetton Master!")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully changed the admin of the Jetton Master!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -21,21 +21,21 @@ NEW_URI = "https://example.com/new-jetton.json"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = JettonMaster.build_change_content_body(
-        new_content=JettonOffchainContent(NEW_URI),
-    )
+        body = JettonMaster.build_change_content_body(
+            new_content=JettonOffchainContent(NEW_URI),
+        )
 
-    tx_hash = await wallet.transfer(
-        destination=JETTON_MASTER_ADDRESS,
-        amount=0.05,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=JETTON_MASTER_ADDRESS,
+            amount=0.05,
+            body=body,
+        )
 
-    print(f"Successfully updated Jetton content!")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully updated Jetton content!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -17,28 +17,28 @@ ADMIN_ADDRESS = "UQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    jetton_master = JettonMaster(
-        content=JettonOnchainContent(
-            name="Ness Jetton",
-            symbol="NESS",
-            description="Probably nothing",
-            decimals=9,
-            image_data=b'image data',
-        ),
-        admin_address=ADMIN_ADDRESS,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=jetton_master.address,
-        amount=0.05,
-        state_init=jetton_master.state_init,
-    )
-
-    print(f"Successfully deployed Jetton Master at address: {jetton_master.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        jetton_master = JettonMaster(
+            content=JettonOnchainContent(
+                name="Ness Jetton",
+                symbol="NESS",
+                description="Probably nothing",
+                decimals=9,
+                image_data=b'image data',
+            ),
+            admin_address=ADMIN_ADDRESS,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=jetton_master.address,
+            amount=0.05,
+            state_init=jetton_master.state_init,
+        )
+
+        print(f"Successfully deployed Jetton Master at address: {jetton_master.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -22,22 +22,22 @@ JETTON_DECIMALS = 9
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    body = JettonMaster.build_mint_body(
-        destination=wallet.address,
-        jetton_amount=int(JETTON_AMOUNT * (10 ** JETTON_DECIMALS)),
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=JETTON_MASTER_ADDRESS,
-        amount=0.05,
-        body=body,
-    )
-
-    print(f"Successfully minted {JETTON_AMOUNT} Jettons!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        body = JettonMaster.build_mint_body(
+            destination=wallet.address,
+            jetton_amount=int(JETTON_AMOUNT * (10 ** JETTON_DECIMALS)),
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=JETTON_MASTER_ADDRESS,
+            amount=0.05,
+            body=body,
+        )
+
+        print(f"Successfully minted {JETTON_AMOUNT} Jettons!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
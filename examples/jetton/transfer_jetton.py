@@ -30,36 +30,36 @@ COMMENT = "Hello from tonutils!"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    jetton_wallet_address = await JettonMaster.get_wallet_address(
-        client=client,
-        owner_address=wallet.address.to_str(),
-        jetton_master_address=JETTON_MASTER_ADDRESS,
-    )
-
-    body = JettonWallet.build_transfer_body(
-        recipient_address=Address(DESTINATION_ADDRESS),
-        response_address=wallet.address,
-        jetton_amount=int(JETTON_AMOUNT * (10 ** JETTON_DECIMALS)),
-        forward_payload=(
-            begin_cell()
-            .store_uint(0, 32)  # Text comment opcode
-            .store_snake_string(COMMENT)
-            .end_cell()
-        ),
-        forward_amount=1,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=jetton_wallet_address,
-        amount=0.05,
-        body=body,
-    )
-
-    print(f"Successfully transferred {JETTON_AMOUNT} jettons!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        jetton_wallet_address = await JettonMaster.get_wallet_address(
+            client=client,
+            owner_address=wallet.address.to_str(),
+            jetton_master_address=JETTON_MASTER_ADDRESS,
+        )
+
+        body = JettonWallet.build_transfer_body(
+            recipient_address=Address(DESTINATION_ADDRESS),
+            response_address=wallet.address,
+            jetton_amount=int(JETTON_AMOUNT * (10 ** JETTON_DECIMALS)),
+            forward_payload=(
+                begin_cell()
+                .store_uint(0, 32)  # Text comment opcode
+                .store_snake_string(COMMENT)
+                .end_cell()
+            ),
+            forward_amount=1,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=jetton_wallet_address,
+            amount=0.05,
+            body=body,
+        )
+
+        print(f"Successfully transferred {JETTON_AMOUNT} jettons!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -24,32 +24,32 @@ ROYALTY_FACTOR = 55  # 5.5% royalty
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    collection = CollectionEditableModified(
-        owner_address=Address(OWNER_ADDRESS),
-        next_item_index=0,
-        content=CollectionModifiedOnchainContent(
-            name="Welcome to TON",
-            description="Each digital artwork represents a memorable token",
-            image_data=b'image data',
-        ),
-        royalty_params=RoyaltyParams(
-            base=ROYALTY_BASE,
-            factor=ROYALTY_FACTOR,
-            address=Address(OWNER_ADDRESS),
-        ),
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=collection.address,
-        amount=0.05,
-        state_init=collection.state_init,
-    )
-
-    print(f"Successfully deployed NFT Collection at address: {collection.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        collection = CollectionEditableModified(
+            owner_address=Address(OWNER_ADDRESS),
+            next_item_index=0,
+            content=CollectionModifiedOnchainContent(
+                name="Welcome to TON",
+                description="Each digital artwork represents a memorable token",
+                image_data=b'image data',
+            ),
+            royalty_params=RoyaltyParams(
+                base=ROYALTY_BASE,
+                factor=ROYALTY_FACTOR,
+                address=Address(OWNER_ADDRESS),
+            ),
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=collection.address,
+            amount=0.05,
+            state_init=collection.state_init,
+        )
+
+        print(f"Successfully deployed NFT Collection at address: {collection.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
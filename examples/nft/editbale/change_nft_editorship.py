@@ -21,21 +21,21 @@ NEW_EDITOR_ADDRESS = "UQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = NFTEditable.build_change_editorship_body(
-        editor_address=Address(NEW_EDITOR_ADDRESS),
-    )
+        body = NFTEditable.build_change_editorship_body(
+            editor_address=Address(NEW_EDITOR_ADDRESS),
+        )
 
-    tx_hash = await wallet.transfer(
-        destination=NFT_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=NFT_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print(f"Successfully changed the editorship of NFT {NFT_ADDRESS} to {NEW_EDITOR_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully changed the editorship of NFT {NFT_ADDRESS} to {NEW_EDITOR_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -30,26 +30,26 @@ ROYALTY_FACTOR = 60  # 6% royalty
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    body = CollectionEditable.build_edit_content_body(
-        content=CollectionOffchainContent(uri=URI, prefix_uri=PREFIX_URI),
-        royalty_params=RoyaltyParams(
-            base=ROYALTY_BASE,
-            factor=ROYALTY_FACTOR,
-            address=Address(ROYALTY_ADDRESS),
-        ),
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=COLLECTION_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
-
-    print(f"Successfully edited the collection at address: {COLLECTION_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        body = CollectionEditable.build_edit_content_body(
+            content=CollectionOffchainContent(uri=URI, prefix_uri=PREFIX_URI),
+            royalty_params=RoyaltyParams(
+                base=ROYALTY_BASE,
+                factor=ROYALTY_FACTOR,
+                address=Address(ROYALTY_ADDRESS),
+            ),
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=COLLECTION_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
+
+        print(f"Successfully edited the collection at address: {COLLECTION_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
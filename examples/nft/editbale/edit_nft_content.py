@@ -20,21 +20,21 @@ SUFFIX_URI = f"new-content.json"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = NFTEditable.build_edit_content_body(
-        content=NFTOffchainContent(suffix_uri=SUFFIX_URI),
-    )
+        body = NFTEditable.build_edit_content_body(
+            content=NFTOffchainContent(suffix_uri=SUFFIX_URI),
+        )
 
-    tx_hash = await wallet.transfer(
-        destination=NFT_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=NFT_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print(f"Successfully edited the content of NFT at address: {NFT_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully edited the content of NFT at address: {NFT_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -16,19 +16,19 @@ SALE_ADDRESS = "EQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = SaleV3R3.build_cancel_sale_body()
+        body = SaleV3R3.build_cancel_sale_body()
 
-    tx_hash = await wallet.transfer(
-        destination=SALE_ADDRESS,
-        amount=0.2,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=SALE_ADDRESS,
+            amount=0.2,
+            body=body,
+        )
 
-    print("Sale has been successfully canceled.")
-    print(f"Transaction hash: {tx_hash}")
+        print("Sale has been successfully canceled.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
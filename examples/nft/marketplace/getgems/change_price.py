@@ -21,30 +21,30 @@ PRICE = 1
 
 
 async def main() -> None:
-    client = TonapiClient(API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    nft_data = await NFT.get_nft_data(client, NFT_ADDRESS)
-    royalty_params = await Collection.get_royalty_params(client, nft_data.collection_address)
-
-    price = int(PRICE * 1e9)
-    royalty_fee = int(price * (royalty_params.base / royalty_params.factor))
-    marketplace_fee = int(price * 0.05)
-
-    body = SaleV3R3.build_change_price_body(
-        marketplace_fee=marketplace_fee,
-        royalty_fee=royalty_fee,
-        price=price,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=SALE_ADDRESS,
-        amount=0.005,
-        body=body,
-    )
-
-    print(f"Successfully updated the price for NFT sale.")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        nft_data = await NFT.get_nft_data(client, NFT_ADDRESS)
+        royalty_params = await Collection.get_royalty_params(client, nft_data.collection_address)
+
+        price = int(PRICE * 1e9)
+        royalty_fee = int(price * (royalty_params.base / royalty_params.factor))
+        marketplace_fee = int(price * 0.05)
+
+        body = SaleV3R3.build_change_price_body(
+            marketplace_fee=marketplace_fee,
+            royalty_fee=royalty_fee,
+            price=price,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=SALE_ADDRESS,
+            amount=0.005,
+            body=body,
+        )
+
+        print(f"Successfully updated the price for NFT sale.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -23,31 +23,31 @@ NFT_INDEX = 0
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    nft = NFTEditableModified(
-        index=NFT_INDEX,
-        collection_address=Address(COLLECTION_ADDRESS),
-    )
-    body = CollectionEditableModified.build_mint_body(
-        index=NFT_INDEX,
-        owner_address=Address(OWNER_ADDRESS),
-        content=NFTModifiedOnchainContent(
-            name="TON Collectible #0",
-            description="Memorable token for completing an onboarding quest about the TON ecosystem",
-            image_data=b'image data',
-        ),
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=COLLECTION_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
-
-    print(f"Successfully minted NFT with index {NFT_INDEX}: {nft.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        nft = NFTEditableModified(
+            index=NFT_INDEX,
+            collection_address=Address(COLLECTION_ADDRESS),
+        )
+        body = CollectionEditableModified.build_mint_body(
+            index=NFT_INDEX,
+            owner_address=Address(OWNER_ADDRESS),
+            content=NFTModifiedOnchainContent(
+                name="TON Collectible #0",
+                description="Memorable token for completing an onboarding quest about the TON ecosystem",
+                image_data=b'image data',
+            ),
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=COLLECTION_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
+
+        print(f"Successfully minted NFT with index {NFT_INDEX}: {nft.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -16,19 +16,19 @@ COLLECTION_ADDRESS = "EQ..."
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = CollectionEditableModified.build_return_balance()
+        body = CollectionEditableModified.build_return_balance()
 
-    tx_hash = await wallet.transfer(
-        destination=COLLECTION_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=COLLECTION_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print(f"Successfully returned the balance of collection {COLLECTION_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully returned the balance of collection {COLLECTION_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
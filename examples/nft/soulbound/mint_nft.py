@@ -26,44 +26,44 @@ SUFFIX_URI = f"{NFT_INDEX}.json"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    nft = NFTSoulbound(
-        index=NFT_INDEX,
-        collection_address=Address(COLLECTION_ADDRESS),
-    )
-    body = CollectionSoulbound.build_mint_body(
-        index=NFT_INDEX,
-        owner_address=Address(OWNER_ADDRESS),
-        content=NFTOffchainContent(suffix_uri=SUFFIX_URI),
-    )
-
-    """ If you deployed the collection using the Modified variant, replace the above code with:
-        Replace `CollectionSoulbound` and `NFTSoulbound` with their modified versions, 
-        and use `NFTModifiedOffchainContent` to specify the full `URI` for the NFT metadata.
-
-    Example:
-
-    nft = NFTSoulboundModified(
-        index=NFT_INDEX,
-        collection_address=Address(COLLECTION_ADDRESS),
-    )
-    body = CollectionSoulboundModified.build_mint_body(
-        index=NFT_INDEX,
-        owner_address=Address(OWNER_ADDRESS),
-        content=NFTModifiedOffchainContent(uri=URI),  # URI example: `https://example.com/nft/0.json`.
-    )
-    """
-
-    tx_hash = await wallet.transfer(
-        destination=COLLECTION_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
-
-    print(f"Successfully minted NFT with index {NFT_INDEX}: {nft.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        nft = NFTSoulbound(
+            index=NFT_INDEX,
+            collection_address=Address(COLLECTION_ADDRESS),
+        )
+        body = CollectionSoulbound.build_mint_body(
+            index=NFT_INDEX,
+            owner_address=Address(OWNER_ADDRESS),
+            content=NFTOffchainContent(suffix_uri=SUFFIX_URI),
+        )
+
+        """ If you deployed the collection using the Modified variant, replace the above code with:
+            Replace `CollectionSoulbound` and `NFTSoulbound` with their modified versions, 
+            and use `NFTModifiedOffchainContent` to specify the full `URI` for the NFT metadata.
+
+        Example:
+
+        nft = NFTSoulboundModified(
+            index=NFT_INDEX,
+            collection_address=Address(COLLECTION_ADDRESS),
+        )
+        body = CollectionSoulboundModified.build_mint_body(
+            index=NFT_INDEX,
+            owner_address=Address(OWNER_ADDRESS),
+            content=NFTModifiedOffchainContent(uri=URI),  # URI example: `https://example.com/nft/0.json`.
+        )
+        """
+
+        tx_hash = await wallet.transfer(
+            destination=COLLECTION_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
+
+        print(f"Successfully minted NFT with index {NFT_INDEX}: {nft.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -17,19 +17,19 @@ NFT_ADDRESS = "EQ..."
 
 async def main() -> None:
     # Initialize TonapiClient and Wallet
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    body = NFTSoulbound.build_revoke_body()
+        body = NFTSoulbound.build_revoke_body()
 
-    tx_hash = await wallet.transfer(
-        destination=NFT_ADDRESS,
-        amount=0.02,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=NFT_ADDRESS,
+            amount=0.02,
+            body=body,
+        )
 
-    print(f"Successfully revoked NFT at address: {NFT_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully revoked NFT at address: {NFT_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -24,26 +24,26 @@ METADATA_URI = f""
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV5R1.from_mnemonic(client, MNEMONIC)
-
-    nft = SweetNFTSoulbound(
-        collection_address=Address(COLLECTION_ADDRESS),
-    )
-    body = SweetCollectionSoulbound.build_mint_body(
-        owner_address=Address(OWNER_ADDRESS),
-        content=SweetOffchainContent(uri=METADATA_URI),
-    )
-
-
-    tx_hash = await wallet.transfer(
-        destination=COLLECTION_ADDRESS,
-        amount=0.2,
-        body=body,
-    )
-
-    print(f"Successfully minted SBT from collection {nft.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV5R1.from_mnemonic(client, MNEMONIC)
+
+        nft = SweetNFTSoulbound(
+            collection_address=Address(COLLECTION_ADDRESS),
+        )
+        body = SweetCollectionSoulbound.build_mint_body(
+            owner_address=Address(OWNER_ADDRESS),
+            content=SweetOffchainContent(uri=METADATA_URI),
+        )
+
+
+        tx_hash = await wallet.transfer(
+            destination=COLLECTION_ADDRESS,
+            amount=0.2,
+            body=body,
+        )
+
+        print(f"Successfully minted SBT from collection {nft.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 from pytoniq_core import Address
+import secrets
 import uuid
 
-from typing import Union
+from typing import Optional, Union
 from tonutils.client import TonapiClient
 from tonutils.nft.content import SweetOffchainContent
 from tonutils.nft.contract.standard.collection import SweetCollectionStandard
@@ -26,38 +27,40 @@ OWNER_ADDRESS_2 = ""
 COLLECTION_ADDRESS = ""
 
 
-def uuid_to_query_id(txn_id: Union[str, uuid.UUID]) -> int:
+def uuid_to_query_id(txn_id: Optional[Union[str, uuid.UUID]] = None) -> int:
+    if txn_id is None:
+        return secrets.randbits(64)  # Random 64-bit query_id when no transaction id is given
     if isinstance(txn_id, str):
         txn_id = uuid.UUID(txn_id)
     return txn_id.int & 0xFFFFFFFFFFFFFFFF  # Use lower 64 bits for query_id
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = HighloadWalletV3.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = HighloadWalletV3.from_mnemonic(client, MNEMONIC)
 
-    nft = SweetNFTStandard(
-        collection_address=Address(COLLECTION_ADDRESS),
-    )
-    body_1 = SweetCollectionStandard.build_mint_body(
-        owner_address=Address(OWNER_ADDRESS_1),
-        query_id=uuid_to_query_id(uuid.uuid4())
-    )
+        nft = SweetNFTStandard(
+            collection_address=Address(COLLECTION_ADDRESS),
+        )
+        body_1 = SweetCollectionStandard.build_mint_body(
+            owner_address=Address(OWNER_ADDRESS_1),
+            query_id=uuid_to_query_id()
+        )
 
-    body_2 = SweetCollectionStandard.build_mint_body(
-        owner_address=Address(OWNER_ADDRESS_2),
-        query_id=uuid_to_query_id(uuid.uuid4())
-    )
+        body_2 = SweetCollectionStandard.build_mint_body(
+            owner_address=Address(OWNER_ADDRESS_2),
+            query_id=uuid_to_query_id()
+        )
 
-    datalist =[]
+        datalist =[]
 
-    datalist.append(TransferData(destination=COLLECTION_ADDRESS, amount=0.02, body=body_2))
-    datalist.append(TransferData(destination=COLLECTION_ADDRESS, amount=0.02, body=body_1))
+        datalist.append(TransferData(destination=COLLECTION_ADDRESS, amount=0.02, body=body_2))
+        datalist.append(TransferData(destination=COLLECTION_ADDRESS, amount=0.02, body=body_1))
 
 
-    tx_hash = await wallet.batch_transfer(datalist)
+        tx_hash = await wallet.batch_transfer(datalist)
 
-    print(f"Successfully minted NFT from collection {nft.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully minted NFT from collection {nft.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 from pytoniq_core import Address
+import secrets
 import uuid
 
-from typing import Union
+from typing import Optional, Union
 from tonutils.client import TonapiClient
 from tonutils.nft.content import SweetOffchainContent
 from tonutils.nft.contract.standard.collection import SweetCollectionStandard
@@ -26,35 +27,36 @@ COLLECTION_ADDRESS = ""
 METADATA_URI = f""
 
 
-def uuid_to_query_id(txn_id: Union[str, uuid.UUID]) -> int:
+def uuid_to_query_id(txn_id: Optional[Union[str, uuid.UUID]] = None) -> int:
+    if txn_id is None:
+        return secrets.randbits(64)  # Random 64-bit query_id when no transaction id is given
     if isinstance(txn_id, str):
         txn_id = uuid.UUID(txn_id)
     return txn_id.int & 0xFFFFFFFFFFFFFFFF  # Use lower 64 bits for query_id
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV5R1.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV5R1.from_mnemonic(client, MNEMONIC)
 
-    nft = SweetNFTStandard(
-        collection_address=Address(COLLECTION_ADDRESS),
-    )
+        nft = SweetNFTStandard(
+            collection_address=Address(COLLECTION_ADDRESS),
+        )
 
-    txn_id = uuid.uuid4()
-    body = SweetCollectionStandard.build_mint_body(
-        owner_address=Address(OWNER_ADDRESS),
-        query_id=uuid_to_query_id(txn_id),
-        amount=100000000
-    )
+        body = SweetCollectionStandard.build_mint_body(
+            owner_address=Address(OWNER_ADDRESS),
+            query_id=uuid_to_query_id(),
+            amount=100000000
+        )
 
 
-    tx_hash = await wallet.transfer(
-        destination=COLLECTION_ADDRESS,
-        amount=0.2,
-        body=body,
-    )
+        tx_hash = await wallet.transfer(
+            destination=COLLECTION_ADDRESS,
+            amount=0.2,
+            body=body,
+        )
 
-    print(f"Successfully minted NFT from collection {nft.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully minted NFT from collection {nft.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
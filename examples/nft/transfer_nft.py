@@ -22,28 +22,28 @@ COMMENT = "Hello from tonutils!"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    body = NFTStandard.build_transfer_body(
-        new_owner_address=Address(NEW_OWNER_ADDRESS),
-        forward_payload=(
-            begin_cell()
-            .store_uint(0, 32)
-            .store_snake_string(COMMENT)
-            .end_cell()
-        ),
-        forward_amount=1,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=NFT_ADDRESS,
-        amount=0.05,
-        body=body,
-    )
-
-    print(f"Successfully transferred NFT from address {NFT_ADDRESS} to new owner {NEW_OWNER_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        body = NFTStandard.build_transfer_body(
+            new_owner_address=Address(NEW_OWNER_ADDRESS),
+            forward_payload=(
+                begin_cell()
+                .store_uint(0, 32)
+                .store_snake_string(COMMENT)
+                .end_cell()
+            ),
+            forward_amount=1,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=NFT_ADDRESS,
+            amount=0.05,
+            body=body,
+        )
+
+        print(f"Successfully transferred NFT from address {NFT_ADDRESS} to new owner {NEW_OWNER_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
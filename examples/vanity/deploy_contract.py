@@ -37,34 +37,34 @@ SALT = ""
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    jetton_master = JettonMaster(
-        content=JettonOnchainContent(
-            name="Ness Jetton",
-            symbol="NESS",
-            description="Probably nothing",
-            decimals=9,
-            image="https://ton.org/download/ton_symbol.png",
-        ),
-        admin_address=wallet.address,
-    )
-    vanity = Vanity(
-        owner_address=wallet.address,
-        salt=SALT,
-    )
-    body = vanity.build_deploy_body(jetton_master)
-
-    tx_hash = await wallet.transfer(
-        destination=vanity.address,
-        amount=0.05,
-        body=body,
-        state_init=vanity.state_init,
-    )
-
-    print(f"Successfully deployed contract at address: {vanity.address.to_str()}")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        jetton_master = JettonMaster(
+            content=JettonOnchainContent(
+                name="Ness Jetton",
+                symbol="NESS",
+                description="Probably nothing",
+                decimals=9,
+                image="https://ton.org/download/ton_symbol.png",
+            ),
+            admin_address=wallet.address,
+        )
+        vanity = Vanity(
+            owner_address=wallet.address,
+            salt=SALT,
+        )
+        body = vanity.build_deploy_body(jetton_master)
+
+        tx_hash = await wallet.transfer(
+            destination=vanity.address,
+            amount=0.05,
+            body=body,
+            state_init=vanity.state_init,
+        )
+
+        print(f"Successfully deployed contract at address: {vanity.address.to_str()}")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -10,40 +10,40 @@ MNEMONIC: list[str] = []
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.batch_dedust_swap_jetton_to_jetton(
-        data_list=[
-            SwapJettonToJettonData(
-                from_jetton_master_address="EQ...",
-                to_jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-            SwapJettonToJettonData(
-                from_jetton_master_address="EQ...",
-                to_jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-            SwapJettonToJettonData(
-                from_jetton_master_address="EQ...",
-                to_jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-            SwapJettonToJettonData(
-                from_jetton_master_address="EQ...",
-                to_jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-        ]
-    )
-
-    print("Successfully swapped TON to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.batch_dedust_swap_jetton_to_jetton(
+            data_list=[
+                SwapJettonToJettonData(
+                    from_jetton_master_address="EQ...",
+                    to_jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+                SwapJettonToJettonData(
+                    from_jetton_master_address="EQ...",
+                    to_jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+                SwapJettonToJettonData(
+                    from_jetton_master_address="EQ...",
+                    to_jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+                SwapJettonToJettonData(
+                    from_jetton_master_address="EQ...",
+                    to_jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+            ]
+        )
+
+        print("Successfully swapped TON to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -10,32 +10,32 @@ MNEMONIC: list[str] = []
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.batch_dedust_swap_ton_to_jetton(
-        data_list=[
-            SwapTONToJettonData(
-                jetton_master_address="EQ...",
-                ton_amount=0.01,
-            ),
-            SwapTONToJettonData(
-                jetton_master_address="EQ...",
-                ton_amount=0.01,
-            ),
-            SwapTONToJettonData(
-                jetton_master_address="EQ...",
-                ton_amount=0.01,
-            ),
-            SwapTONToJettonData(
-                jetton_master_address="EQ...",
-                ton_amount=0.01,
-            ),
-        ]
-    )
-
-    print("Successfully swapped TON to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.batch_dedust_swap_ton_to_jetton(
+            data_list=[
+                SwapTONToJettonData(
+                    jetton_master_address="EQ...",
+                    ton_amount=0.01,
+                ),
+                SwapTONToJettonData(
+                    jetton_master_address="EQ...",
+                    ton_amount=0.01,
+                ),
+                SwapTONToJettonData(
+                    jetton_master_address="EQ...",
+                    ton_amount=0.01,
+                ),
+                SwapTONToJettonData(
+                    jetton_master_address="EQ...",
+                    ton_amount=0.01,
+                ),
+            ]
+        )
+
+        print("Successfully swapped TON to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -19,18 +19,18 @@ JETTON_AMOUNT = 1
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.dedust_swap_jetton_to_jetton(
-        from_jetton_master_address=FROM_JETTON_MASTER_ADDRESS,
-        to_jetton_master_address=TO_JETTON_MASTER_B_ADDRESS,
-        jetton_amount=JETTON_AMOUNT,
-        from_jetton_decimals=JETTON_DECIMALS,
-    )
-
-    print("Successfully swapped Jetton to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.dedust_swap_jetton_to_jetton(
+            from_jetton_master_address=FROM_JETTON_MASTER_ADDRESS,
+            to_jetton_master_address=TO_JETTON_MASTER_B_ADDRESS,
+            jetton_amount=JETTON_AMOUNT,
+            from_jetton_decimals=JETTON_DECIMALS,
+        )
+
+        print("Successfully swapped Jetton to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -15,16 +15,16 @@ SWAP_TON_AMOUNT = 1
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    tx_hash = await wallet.dedust_swap_ton_to_jetton(
-        jetton_master_address=JETTON_MASTER_ADDRESS,
-        ton_amount=SWAP_TON_AMOUNT,
-    )
+        tx_hash = await wallet.dedust_swap_ton_to_jetton(
+            jetton_master_address=JETTON_MASTER_ADDRESS,
+            ton_amount=SWAP_TON_AMOUNT,
+        )
 
-    print("Successfully swapped TON to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+        print("Successfully swapped TON to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -13,37 +13,37 @@ MNEMONIC: list[str] = []
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.batch_stonfi_swap_jetton_to_ton(
-        data_list=[
-            SwapJettonToTONData(
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-            SwapJettonToTONData(
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-            SwapJettonToTONData(
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-            SwapJettonToTONData(
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-            ),
-        ],
-        version=2,  # STONfi Router version
-    )
-
-    print("Successfully swapped TON to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.batch_stonfi_swap_jetton_to_ton(
+            data_list=[
+                SwapJettonToTONData(
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+                SwapJettonToTONData(
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+                SwapJettonToTONData(
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+                SwapJettonToTONData(
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                ),
+            ],
+            version=2,  # STONfi Router version
+        )
+
+        print("Successfully swapped TON to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -21,18 +21,18 @@ JETTON_AMOUNT = 0.01
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.stonfi_swap_jetton_to_ton(
-        jetton_master_address=JETTON_MASTER_ADDRESS,
-        jetton_amount=JETTON_AMOUNT,
-        jetton_decimals=JETTON_DECIMALS,
-        version=2,  # STONfi Router version
-    )
-
-    print("Successfully swapped Jetton to TON!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.stonfi_swap_jetton_to_ton(
+            jetton_master_address=JETTON_MASTER_ADDRESS,
+            jetton_amount=JETTON_AMOUNT,
+            jetton_decimals=JETTON_DECIMALS,
+            version=2,  # STONfi Router version
+        )
+
+        print("Successfully swapped Jetton to TON!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -18,17 +18,17 @@ SWAP_TON_AMOUNT = 0.5
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, _, _, _ = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    tx_hash = await wallet.stonfi_swap_ton_to_jetton(
-        jetton_master_address=JETTON_MASTER_ADDRESS,
-        ton_amount=SWAP_TON_AMOUNT,
-        version=2,  # STONfi Router version
-    )
+        tx_hash = await wallet.stonfi_swap_ton_to_jetton(
+            jetton_master_address=JETTON_MASTER_ADDRESS,
+            ton_amount=SWAP_TON_AMOUNT,
+            version=2,  # STONfi Router version
+        )
 
-    print("Successfully swapped TON to Jetton!")
-    print(f"Transaction hash: {tx_hash}")
+        print("Successfully swapped TON to Jetton!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
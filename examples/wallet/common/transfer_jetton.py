@@ -27,19 +27,19 @@ COMMENT = "Hello from tonutils!"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.transfer_jetton(
-        destination=DESTINATION_ADDRESS,
-        jetton_master_address=JETTON_MASTER_ADDRESS,
-        jetton_amount=JETTON_AMOUNT,
-        jetton_decimals=JETTON_DECIMALS,
-        forward_payload=COMMENT,
-    )
-
-    print(f"Successfully transferred {JETTON_AMOUNT} jettons!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.transfer_jetton(
+            destination=DESTINATION_ADDRESS,
+            jetton_master_address=JETTON_MASTER_ADDRESS,
+            jetton_amount=JETTON_AMOUNT,
+            jetton_decimals=JETTON_DECIMALS,
+            forward_payload=COMMENT,
+        )
+
+        print(f"Successfully transferred {JETTON_AMOUNT} jettons!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -19,17 +19,17 @@ COMMENT = "Hello from tonutils!"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    tx_hash = await wallet.transfer_nft(
-        destination=NEW_OWNER_ADDRESS,
-        nft_address=NFT_ADDRESS,
-        forward_payload=COMMENT,
-    )
+        tx_hash = await wallet.transfer_nft(
+            destination=NEW_OWNER_ADDRESS,
+            nft_address=NFT_ADDRESS,
+            forward_payload=COMMENT,
+        )
 
-    print("Successfully transferred!")
-    print(f"Transaction hash: {tx_hash}")
+        print("Successfully transferred!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
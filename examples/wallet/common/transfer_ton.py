@@ -21,17 +21,17 @@ AMOUNT = 0.01
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
 
-    tx_hash = await wallet.transfer(
-        destination=DESTINATION_ADDRESS,
-        amount=AMOUNT,
-        body=COMMENT,
-    )
+        tx_hash = await wallet.transfer(
+            destination=DESTINATION_ADDRESS,
+            amount=AMOUNT,
+            body=COMMENT,
+        )
 
-    print(f"Successfully transferred {AMOUNT} TON!")
-    print(f"Transaction hash: {tx_hash}")
+        print(f"Successfully transferred {AMOUNT} TON!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -21,22 +21,22 @@ COMMENT = "Hello from tonutils!"
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
-
-    body = await wallet.build_encrypted_comment_body(
-        text=COMMENT,
-        destination=DESTINATION_ADDRESS,
-    )
-
-    tx_hash = await wallet.transfer(
-        destination=DESTINATION_ADDRESS,
-        amount=TRANSFER_AMOUNT,
-        body=body,
-    )
-
-    print(f"Successfully transferred {TRANSFER_AMOUNT} TON to address {DESTINATION_ADDRESS}.")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = WalletV4R2.from_mnemonic(client, MNEMONIC)
+
+        body = await wallet.build_encrypted_comment_body(
+            text=COMMENT,
+            destination=DESTINATION_ADDRESS,
+        )
+
+        tx_hash = await wallet.transfer(
+            destination=DESTINATION_ADDRESS,
+            amount=TRANSFER_AMOUNT,
+            body=body,
+        )
+
+        print(f"Successfully transferred {TRANSFER_AMOUNT} TON to address {DESTINATION_ADDRESS}.")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
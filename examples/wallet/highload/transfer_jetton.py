@@ -13,44 +13,44 @@ MNEMONIC: list[str] = []
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = HighloadWalletV2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.batch_jetton_transfer(
-        data_list=[
-            TransferJettonData(
-                destination="UQ...",
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-                forward_payload="Hello from tonutils!"
-            ),
-            TransferJettonData(
-                destination="UQ...",
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-                forward_payload="Hello from tonutils!"
-            ),
-            TransferJettonData(
-                destination="UQ...",
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-                forward_payload="Hello from tonutils!"
-            ),
-            TransferJettonData(
-                destination="UQ...",
-                jetton_master_address="EQ...",
-                jetton_amount=0.01,
-                jetton_decimals=9,
-                forward_payload="Hello from tonutils!"
-            )
-        ]
-    )
-
-    print("Successfully transferred!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = HighloadWalletV2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.batch_jetton_transfer(
+            data_list=[
+                TransferJettonData(
+                    destination="UQ...",
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                    forward_payload="Hello from tonutils!"
+                ),
+                TransferJettonData(
+                    destination="UQ...",
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                    forward_payload="Hello from tonutils!"
+                ),
+                TransferJettonData(
+                    destination="UQ...",
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                    forward_payload="Hello from tonutils!"
+                ),
+                TransferJettonData(
+                    destination="UQ...",
+                    jetton_master_address="EQ...",
+                    jetton_amount=0.01,
+                    jetton_decimals=9,
+                    forward_payload="Hello from tonutils!"
+                )
+            ]
+        )
+
+        print("Successfully transferred!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
@@ -13,32 +13,32 @@ MNEMONIC: list[str] = []
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = HighloadWalletV2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.batch_nft_transfer(
-        data_list=[
-            TransferNFTData(
-                destination="UQ...",
-                nft_address="EQ...",
-            ),
-            TransferNFTData(
-                destination="UQ...",
-                nft_address="EQ...",
-            ),
-            TransferNFTData(
-                destination="UQ...",
-                nft_address="EQ...",
-            ),
-            TransferNFTData(
-                destination="UQ...",
-                nft_address="EQ...",
-            ),
-        ]
-    )
-
-    print("Successfully transferred!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = HighloadWalletV2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.batch_nft_transfer(
+            data_list=[
+                TransferNFTData(
+                    destination="UQ...",
+                    nft_address="EQ...",
+                ),
+                TransferNFTData(
+                    destination="UQ...",
+                    nft_address="EQ...",
+                ),
+                TransferNFTData(
+                    destination="UQ...",
+                    nft_address="EQ...",
+                ),
+                TransferNFTData(
+                    destination="UQ...",
+                    nft_address="EQ...",
+                ),
+            ]
+        )
+
+        print("Successfully transferred!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
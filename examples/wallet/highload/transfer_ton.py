@@ -13,36 +13,36 @@ MNEMONIC: list[str] = []
 
 
 async def main() -> None:
-    client = TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET)
-    wallet, public_key, private_key, mnemonic = HighloadWalletV2.from_mnemonic(client, MNEMONIC)
-
-    tx_hash = await wallet.batch_transfer(
-        data_list=[
-            TransferData(
-                destination="UQ...",
-                amount=0.01,
-                body="Hello from tonutils!",
-            ),
-            TransferData(
-                destination="UQ...",
-                amount=0.01,
-                body="Hello from tonutils!",
-            ),
-            TransferData(
-                destination="UQ...",
-                amount=0.01,
-                body="Hello from tonutils!",
-            ),
-            TransferData(
-                destination="UQ...",
-                amount=0.01,
-                body="Hello from tonutils!",
-            ),
-        ]
-    )
-
-    print("Successfully transferred!")
-    print(f"Transaction hash: {tx_hash}")
+    async with TonapiClient(api_key=API_KEY, is_testnet=IS_TESTNET) as client:
+        wallet, public_key, private_key, mnemonic = HighloadWalletV2.from_mnemonic(client, MNEMONIC)
+
+        tx_hash = await wallet.batch_transfer(
+            data_list=[
+                TransferData(
+                    destination="UQ...",
+                    amount=0.01,
+                    body="Hello from tonutils!",
+                ),
+                TransferData(
+                    destination="UQ...",
+                    amount=0.01,
+                    body="Hello from tonutils!",
+                ),
+                TransferData(
+                    destination="UQ...",
+                    amount=0.01,
+                    body="Hello from tonutils!",
+                ),
+                TransferData(
+                    destination="UQ...",
+                    amount=0.01,
+                    body="Hello from tonutils!",
+                ),
+            ]
+        )
+
+        print("Successfully transferred!")
+        print(f"Transaction hash: {tx_hash}")
 
 
 if __name__ == "__main__":
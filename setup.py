@@ -25,6 +25,7 @@ setuptools.setup(
     install_requires=[
         "aiohttp>=3.9.0,<3.12",
         "cachetools>=4.1.0,<5.0.0",
+        "orjson>=3.8.0,<4",
         "pycryptodomex~=3.20.0",
         "PyNaCl~=1.5.0",
         "pytoniq-core~=0.1.36",
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+import orjson
 
 from ..account import RawAccount
 from ..exceptions import PytoniqDependencyError
 from .models import TransactionReceipt
 
+# orjson decodes integers wider than 64 bits as floats, so responses containing
+# numbers that long are decoded with the exact stdlib parser instead
+_WIDE_NUMBER = re.compile(rb"\d{19,}")
+
 
 class Client:
     """
@@ -21,6 +28,45 @@ class Client:
         self.timeout = kwargs.get("timeout", 10)
         self.is_testnet = kwargs.get("is_testnet", False)
 
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> Client:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        The session is reused across requests to keep connections alive, but it is bound
+        to the event loop it was created on. When called from another loop (e.g. successive
+        asyncio.run calls), the stale session is closed and a new one is created.
+        Use `async with client:` or `await client.close()` to release the connections.
+
+        :return: The aiohttp client session.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            await self.close()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session, if it was created.
+        """
+        # Detach the session before awaiting, so a session created meanwhile is kept
+        session, self._session, self._session_loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+
     @staticmethod
     async def __read_content(response: aiohttp.ClientResponse) -> Any:
         """
@@ -32,7 +78,8 @@ class Client:
         try:
             data = await response.read()
             try:
-                content = json.loads(data.decode())
+                loads = json.loads if _WIDE_NUMBER.search(data) else orjson.loads
+                content = loads(data)
             except json.JSONDecodeError:
                 content = data.decode()
         except aiohttp.ClientPayloadError as e:
@@ -63,25 +110,26 @@ class Client:
         url = self.base_url + path
         self.headers.update(headers or {})
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=body,
-                    timeout=self.timeout,
-                ) as response:
-                    content = await self.__read_content(response)
-
-                    if not response.ok:
-                        raise aiohttp.ClientResponseError(
-                            request_info=response.request_info,
-                            history=response.history,
-                            status=response.status,
-                            message=content.get("error", content),
-                        )
-
-                    return content
+            session = await self._get_session()
+            async with session.request(
+                method=method,
+                url=url,
+                headers=self.headers,
+                params=params,
+                json=body,
+                timeout=self.timeout,
+            ) as response:
+                content = await self.__read_content(response)
+
+                if not response.ok:
+                    raise aiohttp.ClientResponseError(
+                        request_info=response.request_info,
+                        history=response.history,
+                        status=response.status,
+                        message=content.get("error", content),
+                    )
+
+                return content
 
         except aiohttp.ClientError:
             raise
@@ -143,6 +191,28 @@ class Client:
         """
         raise NotImplementedError
 
+    async def send_messages(self, bocs: List[str], concurrency: int = 16) -> List[Any]:
+        """
+        Send several messages to the blockchain concurrently.
+
+        :param bocs: The bag of cells (BoC) string representations of the messages to be sent.
+        :param concurrency: The maximum number of messages in flight at once. Defaults to 16.
+        :return: The result of each send, in the same order as the given messages.
+            A failed send is returned as its exception instead of being raised.
+        :raises ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(boc: str) -> Any:
+            async with semaphore:
+                return await self.send_message(boc)
+
+        return await asyncio.gather(
+            *[send(boc) for boc in bocs], return_exceptions=True
+        )
+
     async def get_raw_account(self, address: str) -> RawAccount:
         """
         Retrieve raw account information from the blockchain.
@@ -172,6 +242,16 @@ class Client:
         """
         raise NotImplementedError
 
+    async def get_transactions(
+        self, hashes: List[str]
+    ) -> List[Optional[TransactionReceipt]]:
+        """
+        Retrieves the receipts of several transaction nodes concurrently.
+
+        Missing transactions are returned as None, in the same order as the given hashes.
+        """
+        raise NotImplementedError
+
     async def get_collection(self, collection: str) -> dict:
         """
         Retrieve collection from the blockchain.
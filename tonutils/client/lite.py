@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from collections.abc import Callable
 from functools import wraps
 from typing import Any, Dict, List, Optional
@@ -29,9 +31,12 @@ def require_pytoniq(func) -> Callable:
 
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
-        if not pytoniq_available:
-            raise PytoniqDependencyError()
-        await self.initialize_client()
+        # Initialized clients skip the initialize_client call; a balancer that was
+        # closed in the meantime is started up again
+        if not (self._balancer_acquired and self.client.inited):
+            if not pytoniq_available:
+                raise PytoniqDependencyError()
+            await self.initialize_client()
         return await func(self, *args, **kwargs)
 
     return wrapper
@@ -45,6 +50,11 @@ class LiteserverClient(Client):
     with options for configuration and network selection.
     """
 
+    # LiteBalancer instances shared between clients with the same settings on the same
+    # event loop, with usage counts; entries are dropped once their last user closes them
+    _balancer_cache: Dict[tuple, LiteBalancer] = {}
+    _balancer_refs: Dict[tuple, int] = {}
+
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
@@ -69,7 +79,23 @@ class LiteserverClient(Client):
         if not pytoniq_available:
             raise PytoniqDependencyError()
 
-        self.client = self._get_lite_balancer(config, is_testnet, trust_level)
+        self._balancer_settings = (config, is_testnet, trust_level)
+        self._balancer_key: Optional[tuple] = None
+        self._balancer_acquired = False
+        # The balancer is looked up or created when the client is first used
+        self.client: Optional[LiteBalancer] = None
+
+    @staticmethod
+    def _get_balancer_key(
+        config: Optional[Dict[str, Any]], is_testnet: bool, trust_level: int
+    ) -> tuple:
+        # The config is a nested dict, so it is keyed by its canonical JSON form
+        config_key = json.dumps(config, sort_keys=True) if config else None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return config_key, bool(is_testnet), trust_level, loop
 
     @staticmethod
     def _get_lite_balancer(
@@ -81,14 +107,54 @@ class LiteserverClient(Client):
             return LiteBalancer.from_testnet_config(trust_level=trust_level)
         return LiteBalancer.from_mainnet_config(trust_level=trust_level)
 
+    def _acquire_balancer(self) -> None:
+        key = self._get_balancer_key(*self._balancer_settings)
+        balancer = self._balancer_cache.get(key)
+        if balancer is None:
+            # A previously released balancer is reused, unless it is still shared
+            # by clients on another event loop
+            balancer = self.client
+            if balancer is None or any(
+                shared is balancer for shared in self._balancer_cache.values()
+            ):
+                balancer = self._get_lite_balancer(*self._balancer_settings)
+            self._balancer_cache[key] = balancer
+
+        self.client = balancer
+        self._balancer_key = key
+        self._balancer_refs[key] = self._balancer_refs.get(key, 0) + 1
+        self._balancer_acquired = True
+
     async def initialize_client(self) -> None:
+        if not self._balancer_acquired:
+            self._acquire_balancer()
         if not self.client.inited:
             await self.client.start_up()
 
     async def close_client(self) -> None:
+        if not self._balancer_acquired:
+            return
+
+        self._balancer_acquired = False
+        key, self._balancer_key = self._balancer_key, None
+        refs = self._balancer_refs
+        refs[key] -= 1
+        # The shared balancer is only closed when no other client is using it
+        if refs[key] > 0:
+            return
+
+        del refs[key]
+        del self._balancer_cache[key]
         if self.client.inited:
             await self.client.close_all()
 
+    async def close(self) -> None:
+        """
+        Release the LiteBalancer and close the shared HTTP session.
+        """
+        await self.close_client()
+        await super().close()
+
     @require_pytoniq
     async def run_get_method(
         self,
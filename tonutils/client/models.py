@@ -1,59 +1,80 @@
-from typing import Dict, List, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 
 # https://docs.ton.org/v3/documentation/tvm/tvm-exit-codes
+_EXIT_CODES: Dict[int, str] = {
+    0: "standard_successful_execution",
+    1: "alternative_successful_execution_reserved",
+    2: "stack_underflow",
+    3: "stack_overflow",
+    4: "integer_overflow",
+    5: "range_check_error",
+    6: "invalid_tvm_opcode",
+    7: "type_check_error",
+    8: "cell_overflow",
+    9: "cell_underflow",
+    10: "dictionary_error",
+    11: "unknown_error",
+    12: "fatal_error",
+    13: "out_of_gas",
+    -14: "out_of_gas",
+    14: "vm_virtualization_error",
+    32: "action_list_invalid",
+    33: "action_list_too_long",
+    34: "action_invalid_or_not_supported",
+    35: "invalid_source_address",
+    36: "invalid_destination_address",
+    37: "not_enough_toncoin",
+    38: "not_enough_extra_currencies",
+    39: "outbound_message_does_not_fit",
+    40: "cannot_process_message",
+    41: "library_reference_null",
+    42: "library_change_error",
+    43: "exceeded_max_cells_or_depth",
+    50: "account_state_size_exceeded",
+    128: "null_reference_exception",
+    129: "invalid_serialization_prefix",
+    130: "invalid_incoming_message",
+    131: "constraints_error",
+    132: "access_denied",
+    133: "contract_stopped",
+    134: "invalid_argument",
+    135: "contract_code_not_found",
+    136: "invalid_standard_address",
+    137: "masterchain_support_not_enabled",
+    138: "not_a_basechain_address",
+}
+
+# Read-only, with interned values so that comparisons against error names are cheap
+_EXIT_CODE_MAP: Mapping[int, str] = MappingProxyType(
+    {code: sys.intern(name) for code, name in _EXIT_CODES.items()}
+)
+
+_CSKIP_NO_STATE = sys.intern("cskip_no_state")
+
+
+@lru_cache(maxsize=64)
+def _normalize_reason(reason: str) -> str:
+    return sys.intern(reason.lower().replace(" ", "_"))
+
+
 class ExitCode:
-    _code_map = {
-        0: "standard_successful_execution",
-        1: "alternative_successful_execution_reserved",
-        2: "stack_underflow",
-        3: "stack_overflow",
-        4: "integer_overflow",
-        5: "range_check_error",
-        6: "invalid_tvm_opcode",
-        7: "type_check_error",
-        8: "cell_overflow",
-        9: "cell_underflow",
-        10: "dictionary_error",
-        11: "unknown_error",
-        12: "fatal_error",
-        13: "out_of_gas",
-        -14: "out_of_gas",
-        14: "vm_virtualization_error",
-        32: "action_list_invalid",
-        33: "action_list_too_long",
-        34: "action_invalid_or_not_supported",
-        35: "invalid_source_address",
-        36: "invalid_destination_address",
-        37: "not_enough_toncoin",
-        38: "not_enough_extra_currencies",
-        39: "outbound_message_does_not_fit",
-        40: "cannot_process_message",
-        41: "library_reference_null",
-        42: "library_change_error",
-        43: "exceeded_max_cells_or_depth",
-        50: "account_state_size_exceeded",
-        128: "null_reference_exception",
-        129: "invalid_serialization_prefix",
-        130: "invalid_incoming_message",
-        131: "constraints_error",
-        132: "access_denied",
-        133: "contract_stopped",
-        134: "invalid_argument",
-        135: "contract_code_not_found",
-        136: "invalid_standard_address",
-        137: "masterchain_support_not_enabled",
-        138: "not_a_basechain_address",
-    }
+    _code_map = _EXIT_CODE_MAP
 
-    @classmethod
-    def translate(cls, code: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def translate(code: Optional[int]) -> Optional[str]:
         if code is None:
             return None
-        return cls._code_map.get(code, f"unknown_exit_code_{code}")
+        return _EXIT_CODE_MAP.get(code, f"unknown_exit_code_{code}")
 
 
 class PhaseResult:
+    __slots__ = ("success", "skipped", "skip_reason", "exit_code", "error")
+
     def __init__(
         self,
         success: bool,
@@ -65,17 +86,55 @@ class PhaseResult:
         self.skipped = skipped
         self.skip_reason = skip_reason
         self.exit_code = exit_code
+        # Results are immutable after construction, so the error is computed once
+        self.error: Optional[str] = None
+        if skipped and skip_reason:
+            self.error = _normalize_reason(skip_reason)
+        elif not success and exit_code is not None:
+            self.error = ExitCode.translate(exit_code)
+
+
+@lru_cache(maxsize=256)
+def _make_phase(
+    success: bool,
+    skipped: bool,
+    skip_reason: Optional[str],
+    exit_code: Optional[int],
+) -> PhaseResult:
+    # Most phases in a trace are identical, so equal results share one instance.
+    # Shared instances must not be mutated.
+    return PhaseResult(success, skipped, skip_reason, exit_code)
 
-    @property
-    def error(self) -> Optional[str]:
-        if self.skipped and self.skip_reason:
-            return self.skip_reason.lower().replace(" ", "_")
-        if not self.success and self.exit_code is not None:
-            return ExitCode.translate(self.exit_code)
-        return None
+
+def _parse_phase(phase: Optional[Dict]) -> PhaseResult:
+    if not phase:
+        return _make_phase(False, True, "missing_phase_info", None)
+    if phase.get("skipped", False):
+        return _make_phase(False, True, phase.get("skip_reason", "skipped"), None)
+    if "exit_code" in phase:
+        exit_code = phase.get("exit_code")
+    else:
+        exit_code = phase.get("result_code")
+    return _make_phase(phase.get("success", False), False, None, exit_code)
 
 
 class Transaction:
+    __slots__ = (
+        "hash",
+        "block",
+        "account",
+        "success",
+        "timestamp",
+        "total_fees",
+        "end_balance",
+        "op_code",
+        "compute_phase",
+        "action_phase",
+        "error",
+        "interfaces",
+        "children",
+    )
+
     def __init__(
         self,
         hash: str,
@@ -95,7 +154,7 @@ class Transaction:
         children: Optional[List["Transaction"]] = None,
     ):
         self.hash = hash
-        self.block = str(block)
+        self.block = block if isinstance(block, str) else str(block)
         self.account = account
         # success here means not failed or aborted (will be set below)
         self.success = success
@@ -106,53 +165,63 @@ class Transaction:
         self.compute_phase = compute_phase
         self.action_phase = action_phase
         self.error = error
-        self.interfaces = interfaces or []
+        self.interfaces = tuple(interfaces) if interfaces else ()
         self.children = children or []
 
     @classmethod
-    def from_ton_api_trace(cls, data: Dict) -> "Transaction":
-        tx_data = data.get("transaction") if "transaction" in data else data
+    def from_ton_api_trace(
+        cls, data: Dict, parse_failed_subtrees: bool = False
+    ) -> "Transaction":
+        # Nodes are enumerated parents first with an explicit stack, then built in reverse
+        # order so that children already exist when their parent is constructed.
+        # This avoids recursion depth limits on deep traces.
+        nodes: List[Dict] = []
+        child_indices: List[List[int]] = []
+        stack = [(data, -1)]
 
-        def parse_phase(phase: Optional[Dict]) -> PhaseResult:
-            if not phase:
-                return PhaseResult(
-                    success=False,
-                    skipped=True,
-                    skip_reason="missing_phase_info",
-                    exit_code=None,
-                )
-            if phase.get("skipped", False):
-                return PhaseResult(
-                    success=False,
-                    skipped=True,
-                    skip_reason=phase.get("skip_reason", "skipped"),
-                    exit_code=None,
+        while stack:
+            node_data, parent_index = stack.pop()
+            index = len(nodes)
+            fields = cls._parse_ton_api_node(node_data)
+            nodes.append(fields)
+            child_indices.append([])
+            if parent_index >= 0:
+                child_indices[parent_index].append(index)
+
+            # Only traverse children if this transaction is successful, otherwise the subtree is dropped
+            # unless failure details were explicitly requested
+            children_data = node_data.get("children")
+            if (fields["success"] or parse_failed_subtrees) and children_data:
+                stack.extend(
+                    (child_data, index) for child_data in reversed(children_data)
                 )
-            if "exit_code" in phase:
-                exit_code = phase.get("exit_code")
-            else:
-                exit_code = phase.get("result_code")
-            return PhaseResult(
-                success=phase.get("success", False),
-                skipped=False,
-                skip_reason=None,
-                exit_code=exit_code,
-            )
+
+        built: List[Optional[Transaction]] = [None] * len(nodes)
+        for index in range(len(nodes) - 1, -1, -1):
+            children = [built[i] for i in child_indices[index]]
+            built[index] = cls(**nodes[index], children=children)
+
+        return built[0]
+
+    @staticmethod
+    def _parse_ton_api_node(data: Dict) -> Dict:
+        tx_data = data.get("transaction") if "transaction" in data else data
+        get = tx_data.get
 
         # Initial success or aborted check
-        raw_success = tx_data.get("success", False)
-        raw_aborted = tx_data.get("aborted", False)  # assuming aborted field may exist
+        raw_success = get("success", False)
+        raw_aborted = get("aborted", False)  # assuming aborted field may exist
 
         success = raw_success and not raw_aborted
 
-        compute_phase = parse_phase(tx_data.get("compute_phase"))
-        action_phase = parse_phase(tx_data.get("action_phase"))
+        compute_phase = _parse_phase(get("compute_phase"))
+        action_phase = _parse_phase(get("action_phase"))
 
         error = None
         # check compute_phase skipped
         if compute_phase.skipped:
             error = (
-                compute_phase.skip_reason.lower().replace(" ", "_")
+                _normalize_reason(compute_phase.skip_reason)
                 if compute_phase.skip_reason
                 else "compute_phase_skipped"
             )
@@ -169,34 +238,40 @@ class Transaction:
         if error is not None:
             success = False
 
-        children = []
-        # Only traverse children if this transaction is successful, otherwise traverse seems unnecessary
-        if success and data.get("children"):
-            for child_data in data["children"]:
-                child_tx = cls.from_ton_api_trace(child_data)
-                children.append(child_tx)
         interfaces = data.get("interfaces", [])
-        if not interfaces and error == "cskip_no_state":
+        if not interfaces and error == _CSKIP_NO_STATE:
             interfaces = ["uninit"]
 
-        return cls(
-            hash=tx_data.get("hash", ""),
-            block=tx_data.get("block", ""),
+        in_msg = get("in_msg")
+
+        return dict(
+            hash=get("hash", ""),
+            block=get("block", ""),
             account=tx_data["account"].get("address"),
             success=success,
-            timestamp=tx_data.get("utime", 0),
-            total_fees=tx_data.get("total_fees", 0),
-            end_balance=tx_data.get("end_balance", 0),
-            op_code=tx_data.get("in_msg", {}).get("op_code", 0),
+            timestamp=get("utime", 0),
+            total_fees=get("total_fees", 0),
+            end_balance=get("end_balance", 0),
+            op_code=in_msg.get("op_code", 0) if in_msg else 0,
             compute_phase=compute_phase,
             action_phase=action_phase,
             error=error,
             interfaces=interfaces,
-            children=children,
         )
 
 
 class TransactionReceipt:
+    __slots__ = (
+        "hash",
+        "block",
+        "block_hash",
+        "success",
+        "batch_transaction",
+        "raw_transaction",
+        "error",
+        "interfaces",
+    )
+
     def __init__(
         self,
         hash: str,  # hash of the tree root
@@ -221,30 +296,26 @@ class TransactionReceipt:
 
     @classmethod
     def from_transaction(cls, tx: Transaction, block_hash: str) -> "TransactionReceipt":
-        def traverse(tx: Transaction):
-            collected_errors = []
-            batch_node = False
-            interfaces = set()
-
-            if tx.interfaces:
-                interfaces |= set(tx.interfaces)
+        errors: List[str] = []
+        is_batch = False
+        interfaces = set()
 
-            if not tx.success and tx.error:
-                collected_errors.append(tx.error)
-                return collected_errors, batch_node, interfaces  # stop on failed node
+        # Depth-first walk with an explicit stack, children pushed in reverse to keep order
+        stack = [tx]
+        while stack:
+            node = stack.pop()
 
-            if len(tx.children) >= 2:
-                batch_node = True
+            if node.interfaces:
+                interfaces.update(node.interfaces)
 
-            for child in tx.children:
-                child_errors, child_batch, child_interfaces = traverse(child)
-                collected_errors.extend(child_errors)
-                batch_node = batch_node or child_batch
-                interfaces |= set(child_interfaces)
+            if not node.success and node.error:
+                errors.append(node.error)
+                continue  # stop on failed node
 
-            return collected_errors, batch_node, interfaces
+            if len(node.children) >= 2:
+                is_batch = True
 
-        errors, is_batch, interfaces = traverse(tx)
+            stack.extend(reversed(node.children))
 
         return cls(
             hash=tx.hash,
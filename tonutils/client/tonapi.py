@@ -1,5 +1,7 @@
+import asyncio
 from typing import Any, List, Optional
 
+from cachetools import TTLCache
 from pytoniq_core import Cell
 
 from ..account import AccountStatus, RawAccount
@@ -15,6 +17,9 @@ class TonapiClient(Client):
     with options for network selection.
     """
 
+    # Maximum number of account ids sent in a single bulk request
+    BULK_CHUNK_SIZE = 100
+
     def __init__(
         self,
         api_key: str,
@@ -38,6 +43,9 @@ class TonapiClient(Client):
 
         super().__init__(base_url=base_url, headers=headers, is_testnet=is_testnet)
 
+        # Receipts of one batch often share blocks, so their hashes are kept for 10 minutes
+        self._block_hash_cache: TTLCache = TTLCache(maxsize=2048, ttl=600)
+
     async def run_get_method(
         self,
         address: str,
@@ -80,11 +88,17 @@ class TonapiClient(Client):
         )
 
     async def get_account_balance(self, address: str) -> int:
-        raw_account = await self.get_raw_account(address)
+        # Read the balance directly, without decoding the account code and data cells
+        method = f"/v2/blockchain/accounts/{address}"
+        result = await self._get(method=method)
 
-        return raw_account.balance
+        return int(result.get("balance", 0))
+
+    async def get_block_hash(self, block_id: str) -> Optional[str]:
+        root_hash = self._block_hash_cache.get(block_id)
+        if root_hash is not None:
+            return root_hash
 
-    async def get_block_hash(self, block_id: str) -> None:
         method = f"/v2/blockchain/blocks/{block_id}"
         try:
             block = await self._get(method=method)
@@ -92,7 +106,10 @@ class TonapiClient(Client):
             if "not found" in str(e):
                 return None
         if block:
-            return block.get("root_hash")
+            root_hash = block.get("root_hash")
+            if root_hash is not None:
+                self._block_hash_cache[block_id] = root_hash
+            return root_hash
         return None
 
     async def get_transaction(self, address: str, hash: str) -> TransactionReceipt:
@@ -109,6 +126,43 @@ class TonapiClient(Client):
         else:
             return None
 
+    async def get_transactions(
+        self, hashes: List[str]
+    ) -> List[Optional[TransactionReceipt]]:
+        """
+        Retrieve the receipts of several transaction nodes concurrently.
+
+        Transactions are fetched in parallel, then the hashes of their unique blocks
+        are fetched in parallel. Missing transactions are returned as None.
+        """
+        results = await asyncio.gather(
+            *[self._get(method=f"/v2/blockchain/transactions/{h}") for h in hashes],
+            return_exceptions=True,
+        )
+
+        transactions: List[Optional[Transaction]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                if "not found" in str(result):
+                    transactions.append(None)
+                    continue
+                raise result
+            transactions.append(
+                Transaction.from_ton_api_trace(result) if result else None
+            )
+
+        blocks = list({txn.block for txn in transactions if txn is not None})
+        block_hashes = dict(
+            zip(blocks, await asyncio.gather(*[self.get_block_hash(b) for b in blocks]))
+        )
+
+        return [
+            TransactionReceipt.from_transaction(txn, block_hash=block_hashes[txn.block])
+            if txn is not None
+            else None
+            for txn in transactions
+        ]
+
     async def get_collection(self, collection: str) -> dict:
         """
         Retrieve collection from the blockchain.
@@ -121,8 +175,17 @@ class TonapiClient(Client):
         Retrieve collections from the blockchain.
         """
         method = "/v2/nfts/collections/_bulk"
-        result = await self._post(method=method, body={"account_ids": collections})
-        return result["nft_collections"]
+        size = self.BULK_CHUNK_SIZE
+        chunks = [collections[i : i + size] for i in range(0, len(collections), size)]
+        results = await asyncio.gather(
+            *[
+                self._post(method=method, body={"account_ids": chunk})
+                for chunk in chunks
+            ]
+        )
+        return [
+            collection for result in results for collection in result["nft_collections"]
+        ]
 
     async def trace_transaction(self, txn_hash: str) -> TransactionReceipt:
         method = f"/v2/traces/{txn_hash}"
@@ -1,4 +1,4 @@
-from typing import Optional, Union, Any
+from typing import Dict, Optional, Union, Any
 
 from pytoniq_core import (
     Address,
@@ -25,11 +25,32 @@ class Contract:
     """
     Base class representing a smart contract in the TON blockchain.
     """
+    __slots__ = ()
+
     CODE_HEX: Optional[str] = None
 
+    # Decoded code cells shared by all contracts, keyed by their BoC hex string
+    _CODE_CACHE: Dict[str, Cell] = {}
+
     _code: Cell
     _data: Cell
 
+    @classmethod
+    def _code_cell(cls, code_hex: Optional[str] = None) -> Cell:
+        """
+        Retrieve the decoded code cell, parsing the BoC only on first use.
+
+        :param code_hex: The code BoC in hex. Defaults to the class CODE_HEX.
+        :return: The code cell.
+        """
+        if code_hex is None:
+            code_hex = cls.CODE_HEX
+        cell = cls._CODE_CACHE.get(code_hex)
+        if cell is None:
+            cell = Cell.one_from_boc(code_hex)
+            cls._CODE_CACHE[code_hex] = cell
+        return cell
+
     @property
     def code(self) -> Cell:
         """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from pytoniq_core import Cell, Slice, TlbScheme, begin_cell
@@ -7,18 +8,40 @@ from pytoniq_core import Cell, Slice, TlbScheme, begin_cell
 from tonutils.utils import serialize_onchain_dict
 
 
+# Off-chain content is fully described by its strings, so equal contents share cells
+
+@lru_cache(maxsize=128)
+def _offchain_cell(uri: str) -> Cell:
+    return (
+        begin_cell()
+        .store_uint(0x01, 8)
+        .store_snake_string(uri)
+        .end_cell()
+    )
+
+
+@lru_cache(maxsize=128)
+def _snake_cell(text: str) -> Cell:
+    return begin_cell().store_snake_string(text).end_cell()
+
+
+@lru_cache(maxsize=128)
+def _collection_offchain_cell(uri: str, prefix_uri: str) -> Cell:
+    return (
+        begin_cell()
+        .store_ref(_offchain_cell(uri))
+        .store_ref(_snake_cell(prefix_uri))
+        .end_cell()
+    )
+
+
 class BaseOffchainContent(TlbScheme):
 
     def __init__(self, uri: str) -> None:
         self.uri = uri
 
     def serialize(self) -> Cell:
-        return (
-            begin_cell()
-            .store_uint(0x01, 8)
-            .store_snake_string(self.uri)
-            .end_cell()
-        )
+        return _offchain_cell(self.uri)
 
     @classmethod
     def deserialize(cls, cell_slice: Slice) -> BaseOffchainContent:
@@ -31,9 +54,7 @@ class SweetOffchainContent(BaseOffchainContent):
         super().__init__(base_uri)
 
     def serialize(self) -> Cell:
-        return (
-            begin_cell().store_snake_string(self.uri).end_cell()
-        )
+        return _snake_cell(self.uri)
 
 
 class CollectionOffchainContent(BaseOffchainContent):
@@ -43,17 +64,7 @@ class CollectionOffchainContent(BaseOffchainContent):
         self.prefix_uri = prefix_uri
 
     def serialize(self) -> Cell:
-        common_content_cell = (
-            begin_cell()
-            .store_snake_string(self.prefix_uri)
-            .end_cell()
-        )
-        return (
-            begin_cell()
-            .store_ref(super().serialize())
-            .store_ref(common_content_cell)
-            .end_cell()
-        )
+        return _collection_offchain_cell(self.uri, self.prefix_uri)
 
 
 class NFTOffchainContent(BaseOffchainContent):
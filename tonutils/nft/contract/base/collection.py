@@ -1,9 +1,9 @@
 from __future__ import annotations
 import os
 
-from typing import Union
+from typing import Any, Optional, Union
 
-from pytoniq_core import Address, Slice
+from pytoniq_core import Address, Cell, Slice
 
 from ...royalty_params import RoyaltyParams
 from ....client import Client, TonapiClient, ToncenterClient, LiteserverClient
@@ -20,6 +20,43 @@ def get_gas_fee():
 
 
 class Collection(Contract):
+    """
+    Base class for NFT collection contracts.
+
+    The collection data is built from the constructor arguments at construction,
+    only its serialization into the data cell is deferred until first needed
+    (e.g. by `address` or `state_init`). Subclasses may still assign `_data` and `_code` directly.
+    """
+    __slots__ = ("_collection_data", "_data_cell", "_code_value")
+
+    def __init__(self, *init_args: Any) -> None:
+        collection_data = self.create_data(*init_args)
+        next_item_index = collection_data.next_item_index
+        if not 0 <= next_item_index < 1 << 64:
+            raise OverflowError(f"next_item_index not in range(0, {1 << 64}), got {next_item_index}")
+        self._collection_data = collection_data
+        self._data_cell: Optional[Cell] = None
+        self._code_value: Optional[Cell] = None
+
+    @property
+    def _data(self) -> Cell:
+        data = getattr(self, "_data_cell", None)
+        if data is None:
+            data = self._data_cell = self._collection_data.serialize()
+        return data
+
+    @_data.setter
+    def _data(self, value: Cell) -> None:
+        self._data_cell = value
+
+    @property
+    def _code(self) -> Cell:
+        code = getattr(self, "_code_value", None)
+        return code if code is not None else self._code_cell()
+
+    @_code.setter
+    def _code(self, value: Cell) -> None:
+        self._code_value = value
 
     @classmethod
     async def get_royalty_params(
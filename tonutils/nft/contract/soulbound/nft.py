@@ -25,7 +25,7 @@ class NFTSoulboundBase(NFT):
             content: Optional[Union[NFTOffchainContent, NFTModifiedOnchainContent, NFTModifiedOffchainContent, SweetOffchainContent]] = None,
     ) -> None:
         self._data = self.create_data(index, collection_address, owner_address, content).serialize()
-        self._code = Cell.one_from_boc(self.CODE_HEX)
+        self._code = self._code_cell()
 
     @classmethod
     def create_data(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional, Union
 
-from pytoniq_core import Cell, Address
+from pytoniq_core import Address
 
 from ..base.nft import NFT
 from ...content import (
@@ -24,7 +24,7 @@ class NFTStandardBase(NFT):
             content: Optional[Union[NFTOffchainContent, NFTModifiedOnchainContent, NFTModifiedOffchainContent, SweetOffchainContent]] = None,
     ) -> None:
         self._data = self.create_data(index, collection_address, owner_address, content).serialize()
-        self._code = Cell.one_from_boc(self.CODE_HEX)
+        self._code = self._code_cell()
 
     @classmethod
     def create_data(
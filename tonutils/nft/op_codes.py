@@ -19,3 +19,16 @@ CHANGE_NFT_EDITORSHIP_OPCODE = 0x1c04412a
 DESTROY_NFT_OPCODE = 0x1f04537a
 
 REVOKE_NFT_OPCODE = 0x6f89f5e3
+
+# Collection opcodes as 4-byte prefixes, stored together with the query id in one store_bytes call
+NFT_MINT_PREFIX = NFT_MINT_OPCODE.to_bytes(4, "big")
+
+BATCH_NFT_MINT_PREFIX = BATCH_NFT_MINT_OPCODE.to_bytes(4, "big")
+
+CHANGE_COLLECTION_OWNER_PREFIX = CHANGE_COLLECTION_OWNER_OPCODE.to_bytes(4, "big")
+
+COLLECTION_EDIT_CONTENT_PREFIX = COLLECTION_EDIT_CONTENT_OPCODE.to_bytes(4, "big")
+
+RETURN_COLLECTION_BALANCE_PREFIX = RETURN_COLLECTION_BALANCE_OPCODE.to_bytes(4, "big")
+
+ADMIN_NFT_MINT_PREFIX = ADMIN_NFT_MINT_OPCODE.to_bytes(4, "big")
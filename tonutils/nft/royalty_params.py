@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pytoniq_core import Address, Cell, TlbScheme, begin_cell, Slice
 
 
+# Collections deployed with the same royalty configuration share one cell
+@lru_cache(maxsize=128)
+def _royalty_cell(base: int, factor: int, address: Address) -> Cell:
+    return (
+        begin_cell()
+        .store_uint(factor, 16)
+        .store_uint(base, 16)
+        .store_address(address)
+        .end_cell()
+    )
+
+
 class RoyaltyParams(TlbScheme):
 
     def __init__(
@@ -16,13 +30,7 @@ class RoyaltyParams(TlbScheme):
         self.address = address
 
     def serialize(self) -> Cell:
-        return (
-            begin_cell()
-            .store_uint(self.factor, 16)
-            .store_uint(self.base, 16)
-            .store_address(self.address)
-            .end_cell()
-        )
+        return _royalty_cell(self.base, self.factor, self.address)
 
     @classmethod
     def deserialize(cls, cell_slice: Slice) -> RoyaltyParams:
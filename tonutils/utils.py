@@ -3,12 +3,12 @@ import hashlib
 import hmac
 import json
 import os
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
 from Cryptodome.Cipher import AES
 from nacl.bindings import crypto_scalarmult
 from nacl.signing import SigningKey
-from pytoniq_core import Address, Cell, MessageAny, begin_cell, HashMap
+from pytoniq_core import Address, Builder, Cell, MessageAny, begin_cell, HashMap
 
 
 def message_to_boc_hex(message: MessageAny) -> Tuple[str, str]:
@@ -162,3 +162,69 @@ def serialize_onchain_dict(data: Dict[str, Any]) -> Cell:
         dict_cell.set(key, cell.end_cell(), hash_key=True)
 
     return dict_cell.serialize()
+
+
+def serialize_contiguous_dict(
+        from_index: int,
+        values: Sequence[Cell],
+        key_size: int = 64,
+) -> Optional[Cell]:
+    """
+    Serializes cells keyed by consecutive integers into a dictionary cell.
+
+    The result is identical to a HashMap with int keys from_index, from_index + 1, ...
+    and cell values, but the key range is split directly instead of building a trie
+    of bit strings, since every node of a contiguous range is known in advance.
+
+    :param from_index: The key of the first value.
+    :param values: The values in key order, stored into the leaves as is.
+    :param key_size: The key length in bits. Defaults to 64.
+    :return: The root cell of the dictionary, or None if there are no values.
+    """
+    if not values:
+        return None
+
+    last_index = from_index + len(values) - 1
+    if from_index < 0 or last_index >> key_size:
+        raise ValueError(f"Keys {from_index}..{last_index} do not fit into {key_size} bits.")
+
+    return _store_contiguous_edge(begin_cell(), values, 0, from_index, last_index, key_size).end_cell()
+
+
+def _store_contiguous_edge(
+        builder: Builder,
+        values: Sequence[Cell],
+        start: int,
+        low: int,
+        high: int,
+        key_size: int,
+) -> Builder:
+    # The label holds the bits shared by every key in [low, high]
+    rest = (low ^ high).bit_length()
+    _store_label(builder, low >> rest, key_size - rest, key_size)
+
+    if rest == 0:
+        return builder.store_cell(values[start])
+
+    # Fork on the highest remaining bit, both halves of a contiguous range stay contiguous
+    rest -= 1
+    mask = (1 << rest) - 1
+    split = (high >> rest) << rest
+    left = _store_contiguous_edge(begin_cell(), values, start, low & mask, (split - 1) & mask, rest)
+    right = _store_contiguous_edge(begin_cell(), values, start + split - low, 0, high & mask, rest)
+
+    return builder.store_ref(left.end_cell()).store_ref(right.end_cell())
+
+
+def _store_label(builder: Builder, label: int, length: int, key_size: int) -> None:
+    # Picks the shortest of hml_short, hml_long and hml_same, preferring them in that order on ties
+    len_size = key_size.bit_length()
+    short_size = 2 * length + 2
+    long_size = 2 + len_size + length
+
+    if (label == 0 or label == (1 << length) - 1) and 3 + len_size < min(short_size, long_size):
+        builder.store_uint((((0b110 | (label & 1)) << len_size) | length), 3 + len_size)
+    elif long_size < short_size:
+        builder.store_uint((((0b10 << len_size) | length) << length) | label, long_size)
+    else:
+        builder.store_uint((((1 << length) - 1) << (length + 1)) | label, short_size)